@@ -0,0 +1,10 @@
+"""
+Keyword Matcher
+
+Match records produced by rule-based keyword matching.
+"""
+
+from collections import namedtuple
+
+# Lightweight match record: the matched intent and its score
+Match = namedtuple("Match", ["intent", "score"])
@@ -0,0 +1,80 @@
+"""
+Keyword Loader
+
+Loads the intent keyword definitions stored as JSON files next to this
+module and merges them into a single mapping of intent name -> keyword data.
+"""
+
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# Directory holding the bundled *_keywords.json files
+KEYWORDS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (path, mtime_ns, size, inode) per keyword file, used as the cache key
+_Signature = Tuple[Tuple[str, int, int, int], ...]
+
+
+def _keyword_files(keywords_dir: str) -> List[os.DirEntry]:
+    """JSON files in ``keywords_dir``, sorted by name for a stable merge."""
+    with os.scandir(keywords_dir) as entries:
+        files = [
+            entry
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+    return sorted(files, key=lambda entry: entry.name)
+
+
+def _files_signature(files: List[os.DirEntry]) -> _Signature:
+    """Cache key for ``files``; see ``_Signature``."""
+    signature = []
+    for entry in files:
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            # Removed since the directory scan
+            continue
+        key = (entry.path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        signature.append(key)
+    return tuple(signature)
+
+
+def _parse_keyword_file(path: str) -> Optional[Dict[str, Any]]:
+    """Parse one keyword file; skip non-object JSON and vanished files."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        # Removed after it was stat'ed; the next call's signature drops it
+        return None
+    return data if isinstance(data, dict) else None
+
+
+@lru_cache(maxsize=8)
+def _load_cached(signature: _Signature) -> Mapping[str, Any]:
+    """Read and merge the keyword files listed in ``signature``."""
+    # Merge in file-name order so later files win deterministically
+    all_keywords: Dict[str, Any] = {}
+    for path, *_ in signature:
+        data = _parse_keyword_file(path)
+        if data is not None:
+            all_keywords.update(data)
+
+    return MappingProxyType(all_keywords)
+
+
+def load_all_keywords(keywords_dir: str = KEYWORDS_DIR) -> Mapping[str, Any]:
+    """
+    Load all keyword definitions from ``keywords_dir``.
+
+    The merged result is cached and only re-read when a keyword file is
+    added, removed or modified. The result is shared between callers: the
+    top-level mapping is read-only, and nested values are plain JSON data that
+    must not be mutated. Use ``copy.deepcopy(dict(...))`` for a private copy.
+    """
+    keywords_dir = os.path.abspath(keywords_dir)
+    return _load_cached(_files_signature(_keyword_files(keywords_dir)))
@@ -0,0 +1,24 @@
+"""
+Confidence Scoring
+
+Helpers that turn keyword matches into a confidence score for an intent.
+"""
+
+import math
+from typing import Sequence
+
+from app.ai.intent_classification.keyword_matcher import Match
+
+
+def calculate_confidence(matches: Sequence[Match]) -> float:
+    """Highest score among ``matches``, in any order."""
+    if not matches:
+        return 0.0
+    return max(m.score for m in matches)
+
+
+def aggregate_confidence(matches: Sequence[Match]) -> float:
+    """Mean score across all matches."""
+    if not matches:
+        return 0.0
+    return math.fsum(m.score for m in matches) / len(matches)
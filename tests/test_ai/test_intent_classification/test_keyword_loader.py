@@ -0,0 +1,110 @@
+"""Tests for the keyword JSON loader."""
+
+import copy
+import json
+import os
+from collections.abc import Mapping
+
+import pytest
+
+from app.ai.intent_classification.keywords import loader
+from app.ai.intent_classification.keywords.loader import load_all_keywords
+
+
+def _write(directory, name, data):
+    path = directory / name
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_bundled_keywords_load():
+    keywords = load_all_keywords()
+
+    assert isinstance(keywords, Mapping)
+    assert keywords is load_all_keywords(loader.KEYWORDS_DIR)
+
+
+def test_merges_files_and_later_file_wins(tmp_path):
+    _write(tmp_path, "b_keywords.json", {"shared": "from b", "only_b": 2})
+    _write(tmp_path, "a_keywords.json", {"shared": "from a", "only_a": 1})
+
+    assert dict(load_all_keywords(str(tmp_path))) == {
+        "shared": "from b",
+        "only_a": 1,
+        "only_b": 2,
+    }
+
+
+def test_ignores_non_dict_json_and_other_files(tmp_path):
+    _write(tmp_path, "a.json", {"search": 1})
+    _write(tmp_path, "b.json", ["not", "a", "mapping"])
+    (tmp_path / "notes.txt").write_text("{}", encoding="utf-8")
+    (tmp_path / "dir.json").mkdir()
+
+    assert dict(load_all_keywords(str(tmp_path))) == {"search": 1}
+
+
+def test_unchanged_directory_returns_cached_result(tmp_path):
+    _write(tmp_path, "a.json", {"search": 1})
+
+    assert load_all_keywords(str(tmp_path)) is load_all_keywords(str(tmp_path))
+
+
+def test_reloads_on_edit_add_and_delete(tmp_path):
+    path_a = _write(tmp_path, "a.json", {"search": 1})
+    assert dict(load_all_keywords(str(tmp_path))) == {"search": 1}
+
+    _write(tmp_path, "a.json", {"search": 1, "cart": 2})
+    assert dict(load_all_keywords(str(tmp_path))) == {"search": 1, "cart": 2}
+
+    _write(tmp_path, "b.json", {"product": 3})
+    expected = {"search": 1, "cart": 2, "product": 3}
+    assert dict(load_all_keywords(str(tmp_path))) == expected
+
+    path_a.unlink()
+    assert dict(load_all_keywords(str(tmp_path))) == {"product": 3}
+
+
+def test_reloads_when_mtime_is_restored_but_size_changes(tmp_path):
+    path = _write(tmp_path, "a.json", {"search": 1})
+    stat = os.stat(path)
+    assert dict(load_all_keywords(str(tmp_path))) == {"search": 1}
+
+    _write(tmp_path, "a.json", {"search": 12345})
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert dict(load_all_keywords(str(tmp_path))) == {"search": 12345}
+
+
+def test_files_removed_during_load_are_skipped(tmp_path):
+    path = _write(tmp_path, "a.json", {"search": 1})
+    _write(tmp_path, "b.json", {"cart": 2})
+
+    files = loader._keyword_files(str(tmp_path))
+    path.unlink()
+
+    signature = loader._files_signature(files)
+    assert [key[0] for key in signature] == [str(tmp_path / "b.json")]
+    assert loader._parse_keyword_file(str(path)) is None
+
+
+def test_result_is_read_only_at_top_level(tmp_path):
+    _write(tmp_path, "a.json", {"search": {"keywords": ["find", "look for"]}})
+    keywords = load_all_keywords(str(tmp_path))
+
+    assert isinstance(keywords, Mapping)
+    with pytest.raises(TypeError):
+        keywords["cart"] = {}
+
+
+def test_result_round_trips_as_plain_json(tmp_path):
+    data = {"search": {"keywords": ["find", "look for"], "priority": 1}}
+    _write(tmp_path, "a.json", data)
+    keywords = load_all_keywords(str(tmp_path))
+
+    assert json.loads(json.dumps(dict(keywords))) == data
+
+    private = copy.deepcopy(dict(keywords))
+    private["search"]["keywords"].append("browse")
+    reloaded = load_all_keywords(str(tmp_path))
+    assert reloaded["search"]["keywords"] == ["find", "look for"]
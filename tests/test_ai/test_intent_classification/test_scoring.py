@@ -0,0 +1,33 @@
+"""Tests for confidence scoring."""
+
+import pytest
+
+from app.ai.intent_classification import scoring
+from app.ai.intent_classification.keyword_matcher import Match
+
+
+def test_empty_matches_score_zero():
+    assert scoring.calculate_confidence([]) == 0.0
+    assert scoring.aggregate_confidence([]) == 0.0
+
+
+def test_calculate_confidence_is_order_independent():
+    matches = [
+        Match("SEARCH", 0.4),
+        Match("ADD_TO_CART", 0.9),
+        Match("SEARCH", 0.6),
+    ]
+
+    assert scoring.calculate_confidence(matches) == 0.9
+    assert scoring.calculate_confidence(list(reversed(matches))) == 0.9
+
+
+def test_aggregate_confidence_is_mean():
+    matches = [
+        Match("SEARCH", 0.1),
+        Match("SEARCH", 0.2),
+        Match("SEARCH", 0.3),
+    ]
+
+    assert scoring.aggregate_confidence(matches) == pytest.approx(0.2)
+    assert scoring.aggregate_confidence([Match("SEARCH", 0.75)]) == 0.75